@@ -2,6 +2,7 @@
 Card and Deck classes for Skull King game.
 """
 from enum import Enum
+from functools import lru_cache
 from typing import List, Optional
 import random
 
@@ -26,9 +27,16 @@ class CardType(Enum):
     JOLLY_ROGER = "Jolly Roger"  # Trump suit
 
 
+# Special cards: no suit or value, and playable regardless of the led suit
+_SPECIAL_TYPES = frozenset((CardType.ESCAPE, CardType.PIRATE, CardType.MERMAID,
+                            CardType.SKULL_KING, CardType.TIGRESS))
+
+
 class Card:
     """Represents a single card in Skull King."""
     
+    __slots__ = ('card_type', 'suit', 'value')
+    
     def __init__(self, card_type: CardType, suit: Optional[Suit] = None, value: Optional[int] = None):
         """
         Create a card.
@@ -48,8 +56,7 @@ class Card:
                 raise ValueError("Number cards must have a suit")
             if value is None or value < 1 or value > 13:
                 raise ValueError("Number cards must have value 1-13")
-        elif card_type in [CardType.ESCAPE, CardType.PIRATE, CardType.MERMAID, 
-                           CardType.SKULL_KING, CardType.TIGRESS]:
+        elif card_type in _SPECIAL_TYPES:
             self.suit = Suit.SPECIAL
             self.value = None
     
@@ -74,6 +81,8 @@ class Card:
         return self.__str__()
     
     def __eq__(self, other):
+        if other is self:
+            return True
         if not isinstance(other, Card):
             return False
         return (self.card_type == other.card_type and 
@@ -85,8 +94,7 @@ class Card:
     
     def can_follow_suit(self, led_suit: Suit) -> bool:
         """Check if this card can follow the led suit."""
-        if self.card_type in [CardType.ESCAPE, CardType.PIRATE, CardType.MERMAID,
-                              CardType.SKULL_KING, CardType.TIGRESS]:
+        if self.card_type in _SPECIAL_TYPES:
             return True  # Special cards can always be played
         return self.suit == led_suit
     
@@ -155,6 +163,18 @@ class Card:
         return False
 
 
+@lru_cache(maxsize=None)
+def make_card(card_type: CardType, suit: Optional[Suit] = None, value: Optional[int] = None) -> Card:
+    """
+    Get the shared instance of a card.
+    
+    The deck has fewer than 70 distinct cards, so decks are built from one
+    interned instance per card instead of allocating new cards every round.
+    Duplicate cards (e.g. the five Escapes) are the same object.
+    """
+    return Card(card_type, suit, value)
+
+
 class Deck:
     """Represents a deck of Skull King cards."""
     
@@ -168,26 +188,26 @@ class Deck:
         # Number cards: 1-13 in each of 4 suits
         for suit in [Suit.RED, Suit.YELLOW, Suit.BLUE, Suit.GREEN]:
             for value in range(1, 14):
-                self.cards.append(Card(CardType.NUMBER, suit, value))
+                self.cards.append(make_card(CardType.NUMBER, suit, value))
         
         # Special cards
         # 5 Escape cards
         for _ in range(5):
-            self.cards.append(Card(CardType.ESCAPE))
+            self.cards.append(make_card(CardType.ESCAPE))
         
         # 2 Mermaids
         for _ in range(2):
-            self.cards.append(Card(CardType.MERMAID))
+            self.cards.append(make_card(CardType.MERMAID))
         
         # 2 Pirates
         for _ in range(2):
-            self.cards.append(Card(CardType.PIRATE))
+            self.cards.append(make_card(CardType.PIRATE))
         
         # 1 Skull King
-        self.cards.append(Card(CardType.SKULL_KING))
+        self.cards.append(make_card(CardType.SKULL_KING))
         
         # 1 Tigress
-        self.cards.append(Card(CardType.TIGRESS))
+        self.cards.append(make_card(CardType.TIGRESS))
     
     def shuffle(self):
         """Shuffle the deck."""
@@ -2,10 +2,25 @@
 Example bot implementations for Skull King.
 """
 import random
-from typing import List, Dict
-from cards import Card, CardType, Suit
+from typing import List, Dict, Optional
+from cards import Card, CardType, Deck, Suit
 from player import Player
 
+# Bound once so the bots' hot paths skip the module attribute lookup; these
+# stay methods of the shared module-level generator, so random.seed() applies
+_randint = random.randint
+_choice = random.choice
+
+# Special cards AggressiveBot reaches for when it needs a trick, best first
+_WIN_PRIORITY = (CardType.SKULL_KING, CardType.PIRATE, CardType.MERMAID)
+_STRONG_SPECIALS = frozenset(_WIN_PRIORITY)
+
+
+def _is_strong(card: Card) -> bool:
+    """Whether AggressiveBot counts a card towards its bid."""
+    return card.card_type in _STRONG_SPECIALS or (
+        card.card_type == CardType.NUMBER and card.value >= 10)
+
 
 class DummyPlayer(Player):
     """A simple dummy player that makes completely random moves."""
@@ -15,12 +30,12 @@ class DummyPlayer(Player):
     
     def make_bid(self, hand: List[Card], round_num: int, previous_bids: Dict[Player, int]) -> int:
         """Make a completely random bid."""
-        return random.randint(0, round_num)
+        return _randint(0, round_num)
     
-    def play_card(self, hand: List[Card], current_trick: List[tuple], previous_tricks: List[list],
+    def play_card(self, hand: List[Card], current_trick: List[tuple], previous_tricks: List[tuple],
                   bids: Dict[Player, int], tricks_won: Dict[Player, int], round_num: int) -> Card:
         """Play a completely random card from hand."""
-        return random.choice(hand)
+        return _choice(hand)
 
 
 class RandomBot(Player):
@@ -31,13 +46,13 @@ class RandomBot(Player):
     
     def make_bid(self, hand: List[Card], round_num: int, previous_bids: Dict[Player, int]) -> int:
         """Make a random bid."""
-        return random.randint(0, round_num)
+        return _randint(0, round_num)
     
-    def play_card(self, hand: List[Card], current_trick: List[tuple], previous_tricks: List[list],
+    def play_card(self, hand: List[Card], current_trick: List[tuple], previous_tricks: List[tuple],
                   bids: Dict[Player, int], tricks_won: Dict[Player, int], round_num: int) -> Card:
         """Play a random legal card."""
         # Get legal cards (simplified - just return any card)
-        return random.choice(hand)
+        return _choice(hand)
 
 
 class ConservativeBot(Player):
@@ -45,31 +60,46 @@ class ConservativeBot(Player):
     
     def __init__(self, name: str = "ConservativeBot"):
         super().__init__(name)
+        self._bid_by_escapes: List[int] = []
+    
+    def prepare_round(self, round_num: int):
+        """Evaluate bid_from_counts() for every escape count possible this round."""
+        self._bid_by_escapes = [self.bid_from_counts(escapes, 0, round_num)
+                                for escapes in range(round_num + 1)]
     
     def make_bid(self, hand: List[Card], round_num: int, previous_bids: Dict[Player, int]) -> int:
         """Bid low, preferring to bid 0."""
-        # Count escape cards
-        escape_count = sum(1 for card in hand if card.card_type == CardType.ESCAPE)
+        if hand is not self.hand:
+            # Called outside the engine, so the tracked counts don't describe hand
+            escapes = sum(1 for card in hand if card.card_type == CardType.ESCAPE)
+            return self.bid_from_counts(escapes, 0, round_num)
+        if len(self._bid_by_escapes) != round_num + 1:
+            self.prepare_round(round_num)
+        return self._bid_by_escapes[self._type_counts[CardType.ESCAPE]]
+    
+    @staticmethod
+    def bid_from_counts(escape_count: int, strong_count: int, round_num: int) -> int:
+        """Bid from hand composition alone (strong cards don't matter here)."""
         # Bid 0 if we have enough escapes, otherwise bid 1
         if escape_count >= round_num:
             return 0
         return min(1, round_num)
     
-    def play_card(self, hand: List[Card], current_trick: List[tuple], previous_tricks: List[list],
+    def play_card(self, hand: List[Card], current_trick: List[tuple], previous_tricks: List[tuple],
                   bids: Dict[Player, int], tricks_won: Dict[Player, int], round_num: int) -> Card:
         """Try to play escape cards or low cards."""
         # Prefer escape cards
-        escape_cards = [c for c in hand if c.card_type == CardType.ESCAPE]
+        escape_cards = self._by_type[CardType.ESCAPE]
         if escape_cards:
             return escape_cards[0]
         
         # Otherwise play lowest numbered card
-        number_cards = [c for c in hand if c.card_type == CardType.NUMBER]
-        if number_cards:
-            return min(number_cards, key=lambda c: c.value)
+        lowest = self.lowest_number()
+        if lowest is not None:
+            return lowest
         
         # Fallback to random
-        return random.choice(hand)
+        return _choice(hand)
 
 
 class AggressiveBot(Player):
@@ -77,17 +107,40 @@ class AggressiveBot(Player):
     
     def __init__(self, name: str = "AggressiveBot"):
         super().__init__(name)
+        self._bid_by_strong: List[int] = []
+        self._strong_count = 0  # Pirates, Mermaids, Skull King and numbers >= 10 in hand
+    
+    def prepare_round(self, round_num: int):
+        """Evaluate bid_from_counts() for every strong card count possible this round."""
+        self._bid_by_strong = [self.bid_from_counts(0, strong, round_num)
+                               for strong in range(round_num + 1)]
+    
+    def on_card_added(self, card: Card):
+        """Count strong cards as they are dealt."""
+        if _is_strong(card):
+            self._strong_count += 1
+    
+    def on_card_removed(self, card: Card):
+        """Uncount strong cards as they are played."""
+        if _is_strong(card):
+            self._strong_count -= 1
     
     def make_bid(self, hand: List[Card], round_num: int, previous_bids: Dict[Player, int]) -> int:
         """Bid high based on strong cards in hand."""
-        strong_cards = sum(1 for card in hand 
-                          if card.card_type in [CardType.PIRATE, CardType.MERMAID, 
-                                                CardType.SKULL_KING] or
-                          (card.card_type == CardType.NUMBER and card.value >= 10))
-        bid = min(strong_cards, round_num)
+        if hand is not self.hand:
+            # Called outside the engine, so the tracked counts don't describe hand
+            return self.bid_from_counts(0, sum(1 for card in hand if _is_strong(card)), round_num)
+        if len(self._bid_by_strong) != round_num + 1:
+            self.prepare_round(round_num)
+        return self._bid_by_strong[self._strong_count]
+    
+    @staticmethod
+    def bid_from_counts(escape_count: int, strong_count: int, round_num: int) -> int:
+        """Bid from hand composition alone (escapes don't matter here)."""
+        bid = min(strong_count, round_num)
         return max(1, bid)  # At least bid 1
     
-    def play_card(self, hand: List[Card], current_trick: List[tuple], previous_tricks: List[list],
+    def play_card(self, hand: List[Card], current_trick: List[tuple], previous_tricks: List[tuple],
                   bids: Dict[Player, int], tricks_won: Dict[Player, int], round_num: int) -> Card:
         """Play strong cards to win tricks."""
         # If we need to win this trick, play strong cards
@@ -95,27 +148,235 @@ class AggressiveBot(Player):
         
         if tricks_needed > 0 and current_trick:
             # Try to win - play strongest card
-            special_cards = [c for c in hand if c.card_type in 
-                           [CardType.SKULL_KING, CardType.PIRATE, CardType.MERMAID]]
-            if special_cards:
-                # Prefer Skull King, then Pirate, then Mermaid
-                if any(c.card_type == CardType.SKULL_KING for c in special_cards):
-                    return next(c for c in special_cards if c.card_type == CardType.SKULL_KING)
-                if any(c.card_type == CardType.PIRATE for c in special_cards):
-                    return next(c for c in special_cards if c.card_type == CardType.PIRATE)
-                return special_cards[0]
+            # Prefer Skull King, then Pirate, then Mermaid
+            for card_type in _WIN_PRIORITY:
+                cards = self._by_type[card_type]
+                if cards:
+                    return cards[0]
             
             # Play high numbered cards
-            number_cards = [c for c in hand if c.card_type == CardType.NUMBER]
-            if number_cards:
-                return max(number_cards, key=lambda c: c.value)
+            highest = self.highest_number()
+            if highest is not None:
+                return highest
         else:
             # Don't need to win - play escape or low cards
-            escape_cards = [c for c in hand if c.card_type == CardType.ESCAPE]
+            escape_cards = self._by_type[CardType.ESCAPE]
             if escape_cards:
                 return escape_cards[0]
-            number_cards = [c for c in hand if c.card_type == CardType.NUMBER]
-            if number_cards:
-                return min(number_cards, key=lambda c: c.value)
+            lowest = self.lowest_number()
+            if lowest is not None:
+                return lowest
+        
+        return _choice(hand)
+
+
+# Search encoding for MinimaxBot: every distinct card (the five Escapes are
+# one kind, and so on) gets a small int id, and hands are sorted id tuples
+_KINDS: List[Card] = list(dict.fromkeys(Deck().cards))
+_KIND_ID: Dict[Card, int] = {card: i for i, card in enumerate(_KINDS)}
+_SPECIAL_RANKS = {CardType.SKULL_KING: 0, CardType.PIRATE: 1, CardType.MERMAID: 2}
+
+
+def _move_order(kind: int) -> tuple:
+    """Sort key trying special cards first (as AggressiveBot does), then high numbers."""
+    card = _KINDS[kind]
+    if card.card_type in _SPECIAL_RANKS:
+        return (0, _SPECIAL_RANKS[card.card_type])
+    if card.card_type == CardType.NUMBER:
+        return (1, -card.value)
+    return (2, 0)
+
+
+_ORDER = sorted(range(len(_KINDS)), key=_move_order)
+_ORDER_RANK = {kind: i for i, kind in enumerate(_ORDER)}
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+# Most cards left on the table (hand size times players) at which MinimaxBot
+# searches by default; keeps a decision interactive at any table size
+_SEARCH_CARDS = 12
+
+
+class MinimaxBot(AggressiveBot):
+    """
+    A bot that searches the last few tricks of a round with alpha-beta pruning.
+    
+    Opponents' hands are hidden, so each decision samples several deals of
+    the unseen cards and searches each one as a perfect-information game
+    where all opponents play against this bot. The move with the highest
+    score summed over the samples is played. Ties go to the AggressiveBot
+    choice, or else to the strongest card while tricks are still needed and
+    the cheapest one otherwise, so cards aren't thrown away when the search
+    sees no difference. Bids, and plays with more than max_depth cards in
+    hand, use the AggressiveBot heuristics.
+    """
+    
+    def __init__(self, name: str = "MinimaxBot", max_depth: Optional[int] = None,
+                 samples: int = 8):
+        """
+        Args:
+            name: Name of the bot
+            max_depth: Search only when holding at most this many cards;
+                by default as many as keep 12 cards on the table, so 4 with
+                3 players and 2 with 6
+            samples: Number of sampled deals searched per decision
+        """
+        super().__init__(name)
+        self.max_depth = max_depth
+        self.samples = samples
+        # Own generator for sampling deals, so searching doesn't shift the
+        # shared generator's shuffles for the rest of the game
+        self._rng = random.Random(name)
+        # Bid, round and transposition table of the decision being searched
+        self._bid = 0
+        self._round_num = 0
+        self._table: Dict[tuple, tuple] = {}
+    
+    def play_card(self, hand: List[Card], current_trick: List[tuple], previous_tricks: List[tuple],
+                  bids: Dict[Player, int], tricks_won: Dict[Player, int], round_num: int) -> Card:
+        """Search the endgame, or play like AggressiveBot earlier in the round."""
+        fallback = super().play_card(hand, current_trick, previous_tricks, bids, tricks_won, round_num)
+        num_players = len(bids)
+        max_depth = self.max_depth
+        if max_depth is None:
+            max_depth = _SEARCH_CARDS // max(num_players, 1)
+        if len(hand) > max_depth or self.seat_id is None:
+            return fallback
+        
+        self._bid = bids.get(self, 0)
+        self._round_num = round_num
+        self._table = {}
+        
+        # Cards nobody has shown yet are in the opponents' hands
+        unseen = Deck().cards
+        for card in hand:
+            unseen.remove(card)
+        for trick in previous_tricks:
+            for _, card in trick:
+                unseen.remove(card)
+        for _, card in current_trick:
+            unseen.remove(card)
+        played = {player.seat_id for player, _ in current_trick}
         
-        return random.choice(hand)
\ No newline at end of file
+        trick = tuple(_KIND_ID[card] for _, card in current_trick)
+        totals: Dict[int, float] = {}
+        for _ in range(self.samples):
+            self._rng.shuffle(unseen)
+            hands = []
+            dealt = 0
+            for seat in range(num_players):
+                if seat == self.seat_id:
+                    hands.append(tuple(sorted(_KIND_ID[card] for card in hand)))
+                    continue
+                num_cards = len(hand) - (1 if seat in played else 0)
+                hands.append(tuple(sorted(_KIND_ID[card] for card in unseen[dealt:dealt + num_cards])))
+                dealt += num_cards
+            for move, value in self._move_values(tuple(hands), trick, tricks_won.get(self, 0)).items():
+                totals[move] = totals.get(move, 0) + value
+        
+        # Among equally good moves, keep the AggressiveBot choice if it is one
+        # of them, else spend the strongest card only while tricks are needed
+        best_total = max(totals.values())
+        best = [move for move in totals if totals[move] == best_total]
+        if _KIND_ID[fallback] in best:
+            return fallback
+        if bids.get(self, 0) > tricks_won.get(self, 0):
+            move = min(best, key=_ORDER_RANK.__getitem__)
+        else:
+            move = max(best, key=_ORDER_RANK.__getitem__)
+        return next(card for card in hand if _KIND_ID[card] == move)
+    
+    def _legal_moves(self, hand: tuple, trick: tuple) -> List[int]:
+        """Distinct legal card ids in a hand, in move order."""
+        moves = set(hand)
+        if trick:
+            led = _KINDS[trick[0]]
+            if led.card_type == CardType.NUMBER:
+                following = {k for k in moves
+                             if _KINDS[k].card_type == CardType.NUMBER and _KINDS[k].suit == led.suit}
+                if following:
+                    moves = following
+        return sorted(moves, key=_ORDER_RANK.__getitem__)
+    
+    def _score(self, tricks_won: int) -> int:
+        """Round score for this bot, as SkullKingGame.calculate_scores() computes it."""
+        bid = self._bid
+        if bid == 0:
+            return 10 * self._round_num if tricks_won == 0 else -10 * self._round_num
+        if bid == tricks_won:
+            return bid * 20 + 10
+        return -10 * abs(bid - tricks_won)
+    
+    def _move_values(self, hands: tuple, trick: tuple, tricks_won: int) -> Dict[int, float]:
+        """This bot's round score after each legal card id, in one sampled deal."""
+        return {move: self._alphabeta(*self._play(hands, trick, tricks_won, move),
+                                      float('-inf'), float('inf'))
+                for move in self._legal_moves(hands[self.seat_id], trick)}
+    
+    def _play(self, hands: tuple, trick: tuple, tricks_won: int, move: int) -> tuple:
+        """Apply a move; returns (hands, trick, tricks_won, bonus) after it."""
+        seat = len(trick)  # Seat 0 leads every trick and play goes in seat order
+        hand = list(hands[seat])
+        hand.remove(move)
+        hands = hands[:seat] + (tuple(hand),) + hands[seat + 1:]
+        trick = trick + (move,)
+        bonus = 0
+        if len(trick) == len(hands):
+            cards = [_KINDS[k] for k in trick]
+            led_suit = cards[0].suit if cards[0].card_type == CardType.NUMBER else Suit.SPECIAL
+            winner = 0
+            for i in range(1, len(cards)):
+                if cards[i].beats(cards[winner], led_suit):
+                    winner = i
+            if winner == self.seat_id:
+                tricks_won += 1
+                if any(c.card_type == CardType.SKULL_KING for c in cards):
+                    if cards[winner].card_type == CardType.MERMAID:
+                        bonus = 100
+                    elif cards[winner].card_type == CardType.PIRATE:
+                        bonus = 50
+            trick = ()
+        return hands, trick, tricks_won, bonus
+    
+    def _alphabeta(self, hands: tuple, trick: tuple, tricks_won: int, bonus: int,
+                   alpha: float, beta: float) -> float:
+        """Value for this bot of a position, with all opponents minimizing it."""
+        if not any(hands):
+            return bonus + self._score(tricks_won)
+        
+        key = (hands, trick, tricks_won)
+        entry = self._table.get(key)
+        if entry is not None:
+            value, flag = entry
+            if flag == _EXACT:
+                return bonus + value
+            if flag == _LOWER:
+                alpha = max(alpha, value + bonus)
+            else:
+                beta = min(beta, value + bonus)
+            if alpha >= beta:
+                return bonus + value
+        
+        # Search the remainder without this position's bonus so table
+        # entries don't depend on how the position was reached
+        alpha_rest, beta_rest = alpha - bonus, beta - bonus
+        seat = len(trick)
+        maximizing = seat == self.seat_id
+        best = float('-inf') if maximizing else float('inf')
+        for move in self._legal_moves(hands[seat], trick):
+            value = self._alphabeta(*self._play(hands, trick, tricks_won, move), alpha_rest, beta_rest)
+            if maximizing:
+                best = max(best, value)
+                alpha_rest = max(alpha_rest, best)
+            else:
+                best = min(best, value)
+                beta_rest = min(beta_rest, best)
+            if alpha_rest >= beta_rest:
+                break
+        
+        if best <= alpha - bonus:
+            self._table[key] = (best, _UPPER)
+        elif best >= beta - bonus:
+            self._table[key] = (best, _LOWER)
+        else:
+            self._table[key] = (best, _EXACT)
+        return bonus + best
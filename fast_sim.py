@@ -0,0 +1,279 @@
+"""
+Numba-compiled simulator for headless mass play between the example bots.
+
+Replays the rules of game_engine and the decision logic of the bots in
+example_bots over small integer arrays, so thousands of games can be run
+for bot tuning without the Python interpreter in the inner loop. Only bots
+whose exact class is listed in NATIVE_BOT_KINDS can be simulated; anything
+else must go through the regular SkullKingGame path.
+
+Requires numpy and numba (pip install numba).
+"""
+from typing import List, Optional
+
+import numpy as np
+from numba import njit, prange
+
+from cards import CardType, Deck, Suit
+from example_bots import AggressiveBot, ConservativeBot, DummyPlayer, RandomBot
+from player import Player
+
+# Card type codes
+ESCAPE = 0
+NUMBER = 1
+PIRATE = 2
+MERMAID = 3
+SKULL_KING = 4
+TIGRESS = 5
+
+SPECIAL_SUIT = 4  # Suit code for special cards (suits 0-3 are the number suits)
+
+# Bot kind codes
+RANDOM = 0
+CONSERVATIVE = 1
+AGGRESSIVE = 2
+
+NATIVE_BOT_KINDS = {
+    DummyPlayer: RANDOM,
+    RandomBot: RANDOM,
+    ConservativeBot: CONSERVATIVE,
+    AggressiveBot: AGGRESSIVE,
+}
+
+_TYPE_CODES = {
+    CardType.ESCAPE: ESCAPE,
+    CardType.NUMBER: NUMBER,
+    CardType.PIRATE: PIRATE,
+    CardType.MERMAID: MERMAID,
+    CardType.SKULL_KING: SKULL_KING,
+    CardType.TIGRESS: TIGRESS,
+}
+_SUIT_CODES = {Suit.RED: 0, Suit.YELLOW: 1, Suit.BLUE: 2, Suit.GREEN: 3, Suit.SPECIAL: SPECIAL_SUIT}
+
+
+def _encode_deck():
+    """Encode the standard deck as parallel type/suit/value arrays."""
+    cards = Deck().cards
+    types = np.array([_TYPE_CODES[c.card_type] for c in cards], dtype=np.int8)
+    suits = np.array([_SUIT_CODES[c.suit] for c in cards], dtype=np.int8)
+    values = np.array([c.value or 0 for c in cards], dtype=np.int8)
+    return types, suits, values
+
+
+CARD_TYPE, CARD_SUIT, CARD_VALUE = _encode_deck()
+DECK_SIZE = len(CARD_TYPE)
+
+# Skull King < Mermaid < Pirate, indexed by type code; 0 for non-ranked cards
+SPECIAL_RANK = np.array([0, 0, 5, 4, 3, 0], dtype=np.int8)
+
+# Per-card 0/1 flags so bidding counts with table lookups instead of branches
+CARD_IS_ESCAPE = (CARD_TYPE == ESCAPE).astype(np.int8)
+CARD_IS_STRONG = (np.isin(CARD_TYPE, (PIRATE, MERMAID, SKULL_KING)) |
+                  ((CARD_TYPE == NUMBER) & (CARD_VALUE >= 10))).astype(np.int8)
+
+
+@njit(cache=True)
+def _beats(card, other, led_suit):
+    """Card.beats() for encoded cards (no trump suit)."""
+    t = CARD_TYPE[card]
+    other_t = CARD_TYPE[other]
+    if t == ESCAPE:
+        return False
+    if other_t == ESCAPE:
+        return True
+    rank = SPECIAL_RANK[t]
+    other_rank = SPECIAL_RANK[other_t]
+    if rank > 0 and other_rank > 0:
+        return rank > other_rank
+    if rank > 0:
+        return True
+    if other_rank > 0:
+        return False
+    if t == NUMBER and other_t == NUMBER:
+        if CARD_SUIT[card] == CARD_SUIT[other]:
+            return CARD_VALUE[card] > CARD_VALUE[other]
+        return CARD_SUIT[card] == led_suit
+    return False
+
+
+@njit(cache=True)
+def _find_type(hand, hand_len, card_type):
+    """Position of the first card of a type in hand, or -1."""
+    for i in range(hand_len):
+        if CARD_TYPE[hand[i]] == card_type:
+            return i
+    return -1
+
+
+@njit(cache=True)
+def _lowest_number(hand, hand_len):
+    """Position of the first lowest number card in hand, or -1."""
+    best = -1
+    for i in range(hand_len):
+        card = hand[i]
+        if CARD_TYPE[card] == NUMBER and (best < 0 or CARD_VALUE[card] < CARD_VALUE[hand[best]]):
+            best = i
+    return best
+
+
+@njit(cache=True)
+def _highest_number(hand, hand_len):
+    """Position of the first highest number card in hand, or -1."""
+    best = -1
+    for i in range(hand_len):
+        card = hand[i]
+        if CARD_TYPE[card] == NUMBER and (best < 0 or CARD_VALUE[card] > CARD_VALUE[hand[best]]):
+            best = i
+    return best
+
+
+# The example bots' own bid formulas, compiled, so the simulator bids exactly
+# as make_bid() does
+_conservative_bid = njit(cache=True)(ConservativeBot.bid_from_counts)
+_aggressive_bid = njit(cache=True)(AggressiveBot.bid_from_counts)
+
+
+@njit(cache=True)
+def _make_bid(kind, hand, hand_len, round_num):
+    """Bid for one bot by counting its hand and applying its bid_from_counts()."""
+    if kind == RANDOM:
+        return np.random.randint(0, round_num + 1)
+    escapes = 0
+    strong = 0
+    for i in range(hand_len):
+        escapes += CARD_IS_ESCAPE[hand[i]]
+        strong += CARD_IS_STRONG[hand[i]]
+    if kind == CONSERVATIVE:
+        return _conservative_bid(escapes, strong, round_num)
+    return _aggressive_bid(escapes, strong, round_num)
+
+
+@njit(cache=True)
+def _choose_card(kind, hand, hand_len, trick_len, tricks_needed):
+    """Hand position one bot plays, following its play_card() in example_bots."""
+    if kind == AGGRESSIVE and tricks_needed > 0 and trick_len > 0:
+        for card_type in (SKULL_KING, PIRATE, MERMAID):
+            pos = _find_type(hand, hand_len, card_type)
+            if pos >= 0:
+                return pos
+        pos = _highest_number(hand, hand_len)
+        if pos >= 0:
+            return pos
+    elif kind != RANDOM:
+        pos = _find_type(hand, hand_len, ESCAPE)
+        if pos >= 0:
+            return pos
+        pos = _lowest_number(hand, hand_len)
+        if pos >= 0:
+            return pos
+    return np.random.randint(0, hand_len)
+
+
+@njit(cache=True)
+def _play_game(kinds, num_rounds, scores):
+    """Play one full game, accumulating each seat's final score into scores."""
+    n_bots = len(kinds)
+    hands = np.empty((n_bots, num_rounds), dtype=np.int8)
+    hand_lens = np.empty(n_bots, dtype=np.int64)
+    bids = np.empty(n_bots, dtype=np.int64)
+    tricks_won = np.empty(n_bots, dtype=np.int64)
+    trick = np.empty(n_bots, dtype=np.int8)
+
+    for round_num in range(1, num_rounds + 1):
+        # Deal
+        deck = np.random.permutation(DECK_SIZE)
+        for s in range(n_bots):
+            for i in range(round_num):
+                hands[s, i] = deck[s * round_num + i]
+            hand_lens[s] = round_num
+            tricks_won[s] = 0
+        for s in range(n_bots):
+            bids[s] = _make_bid(kinds[s], hands[s], hand_lens[s], round_num)
+
+        for _ in range(round_num):
+            led_suit = SPECIAL_SUIT
+            for s in range(n_bots):
+                hand = hands[s]
+                hand_len = hand_lens[s]
+                pos = _choose_card(kinds[s], hand, hand_len, s, bids[s] - tricks_won[s])
+
+                # Replace an illegal choice with the first legal card, as the
+                # headless runner does
+                if s > 0 and led_suit != SPECIAL_SUIT:
+                    card = hand[pos]
+                    if not (CARD_TYPE[card] == NUMBER and CARD_SUIT[card] == led_suit):
+                        for i in range(hand_len):
+                            if CARD_TYPE[hand[i]] == NUMBER and CARD_SUIT[hand[i]] == led_suit:
+                                pos = i
+                                break
+
+                card = hand[pos]
+                for i in range(pos, hand_len - 1):
+                    hand[i] = hand[i + 1]
+                hand_lens[s] = hand_len - 1
+                trick[s] = card
+                if s == 0:
+                    led_suit = CARD_SUIT[card] if CARD_TYPE[card] == NUMBER else SPECIAL_SUIT
+
+            winner = 0
+            skull_king_played = CARD_TYPE[trick[0]] == SKULL_KING
+            for s in range(1, n_bots):
+                if CARD_TYPE[trick[s]] == SKULL_KING:
+                    skull_king_played = True
+                if _beats(trick[s], trick[winner], led_suit):
+                    winner = s
+            tricks_won[winner] += 1
+
+            # Skull King capture bonuses
+            if skull_king_played:
+                if CARD_TYPE[trick[winner]] == MERMAID:
+                    scores[winner] += 100
+                elif CARD_TYPE[trick[winner]] == PIRATE:
+                    scores[winner] += 50
+
+        for s in range(n_bots):
+            bid = bids[s]
+            won = tricks_won[s]
+            if bid == 0:
+                scores[s] += 10 * round_num if won == 0 else -10 * round_num
+            elif bid == won:
+                scores[s] += bid * 20 + 10
+            else:
+                scores[s] -= 10 * abs(bid - won)
+
+
+@njit(parallel=True, cache=True)
+def simulate_games(n_games, n_rounds, kinds, seed):
+    """
+    Play n_games independent games in parallel.
+
+    Args:
+        n_games: Number of games to play
+        n_rounds: Rounds per game (1-10)
+        kinds: int8 array of bot kind codes, one per seat
+        seed: Base random seed; game g is seeded with seed + g
+
+    Returns:
+        (n_games, n_bots) int32 array of final scores
+    """
+    scores = np.zeros((n_games, len(kinds)), dtype=np.int32)
+    for g in prange(n_games):
+        np.random.seed(seed + g)
+        _play_game(kinds, n_rounds, scores[g])
+    return scores
+
+
+def bot_kinds(bots: List[Player]) -> Optional[np.ndarray]:
+    """
+    Encode bots for simulate_games().
+
+    Returns:
+        int8 array of kind codes, or None if any bot is not a native type
+    """
+    kinds = []
+    for bot in bots:
+        kind = NATIVE_BOT_KINDS.get(type(bot))
+        if kind is None:
+            return None
+        kinds.append(kind)
+    return np.array(kinds, dtype=np.int8)
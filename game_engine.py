@@ -9,10 +9,14 @@ from player import Player
 class Trick:
     """Represents a single trick in the game."""
     
-    def __init__(self, round_num: int, trick_num: int, trump_suit: Optional[Suit] = None):
+    def __init__(self, round_num: int, trick_num: int, trump_suit: Optional[Suit] = None,
+                 lead_seat: int = 0):
         self.round_num = round_num
         self.trick_num = trick_num
         self.trump_suit = trump_suit
+        # Seat (index into the game's players) that plays first; play then
+        # proceeds in seat order, so the next seat is lead_seat + cards played
+        self.lead_seat = lead_seat
         self.cards_played: List[Tuple[Player, Card]] = []
         self.led_suit: Optional[Suit] = None
         self.winner: Optional[Player] = None
@@ -62,6 +66,9 @@ class GameState:
         self.hands: Dict[Player, List[Card]] = {}
         self.current_trick: Optional[Trick] = None
         self.tricks: List[Trick] = []
+        # Frozen cards_played of each completed trick, in the shape bots receive
+        # as previous_tricks; tuples so a bot can't alter the scored tricks
+        self.previous_tricks: List[Tuple[Tuple[Player, Card], ...]] = []
         self.trump_suit: Optional[Suit] = None
         self.scores: Dict[Player, int] = {player: 0 for player in players}
         self.game_over = False
@@ -86,6 +93,31 @@ class GameState:
         
         # Can play any card (either no suit to follow, or special cards)
         return self.hands[player]
+    
+    def is_legal(self, player: Player, card: Card) -> bool:
+        """
+        Check whether a player may play a card in the current trick.
+        
+        Equivalent to ``card in get_legal_cards(player)`` without building
+        the list of legal cards. Checking the card is in hand scans the hand
+        once; a second scan, for a card of the led suit, is only needed when
+        the card does not follow it.
+        """
+        hand = self.hands[player]
+        if card not in hand:
+            return False
+        
+        if not self.current_trick or not self.current_trick.cards_played:
+            return True
+        
+        led_suit = self.current_trick.led_suit
+        if not led_suit or led_suit == Suit.SPECIAL:
+            return True
+        if card.card_type == CardType.NUMBER and card.suit == led_suit:
+            return True
+        
+        # Off-suit card: only legal if the player cannot follow suit
+        return not any(c.card_type == CardType.NUMBER and c.suit == led_suit for c in hand)
 
 
 class SkullKingGame:
@@ -105,6 +137,8 @@ class SkullKingGame:
             raise ValueError("Maximum 6 players supported")
         
         self.players = players
+        for seat_id, player in enumerate(players):
+            player.seat_id = seat_id
         self.num_rounds = num_rounds
         self.current_round = 0
         self.deck = Deck()
@@ -126,7 +160,8 @@ class SkullKingGame:
         
         # Deal cards
         for player in self.players:
-            state.hands[player] = self.deck.deal(num_cards)
+            player.prepare_round(round_num)
+            state.hands[player] = player.receive_hand(self.deck.deal(num_cards))
             state.tricks_won[player] = 0
         
         self.state = state
@@ -154,7 +189,7 @@ class SkullKingGame:
             raise RuntimeError("No active round")
         
         trick_num = len(self.state.tricks) + 1
-        trick = Trick(self.state.round_num, trick_num, self.state.trump_suit)
+        trick = Trick(self.state.round_num, trick_num, self.state.trump_suit, lead_seat=0)
         self.state.current_trick = trick
         return trick
     
@@ -169,12 +204,12 @@ class SkullKingGame:
             raise RuntimeError("No active trick")
         
         # Validate card is legal
-        legal_cards = self.state.get_legal_cards(player)
-        if card not in legal_cards:
+        if not self.state.is_legal(player, card):
+            legal_cards = self.state.get_legal_cards(player)
             raise ValueError(f"Illegal card play: {card} not in legal cards {legal_cards}")
         
-        # Remove card from hand
-        self.state.hands[player].remove(card)
+        # Remove card from hand (state.hands shares the player's hand list)
+        player.remove_card(card)
         
         # Play card
         self.state.current_trick.play_card(player, card)
@@ -184,14 +219,22 @@ class SkullKingGame:
             # Determine winner
             winner = self.state.current_trick.determine_winner()
             if winner:
-                self.state.tricks_won[winner] = self.state.tricks_won.get(winner, 0) + 1
+                self.state.tricks_won[winner] += 1
             
             self.state.tricks.append(self.state.current_trick)
+            self.state.previous_tricks.append(tuple(self.state.current_trick.cards_played))
             self.state.current_trick = None
             return True
         
         return False
     
+    def next_player(self) -> Optional[Player]:
+        """Get the player due to play next in the current trick, if any."""
+        trick = self.state.current_trick if self.state else None
+        if not trick or len(trick.cards_played) >= len(self.players):
+            return None
+        return self.players[(trick.lead_seat + len(trick.cards_played)) % len(self.players)]
+    
     def calculate_scores(self) -> Dict[Player, int]:
         """Calculate scores for the current round."""
         if not self.state:
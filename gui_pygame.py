@@ -679,12 +679,7 @@ class SkullKingGUI:
         
         trick = self.game.state.current_trick
         
-        played_players = {p for p, _ in trick.cards_played}
-        next_player = None
-        for player in self.game.players:
-            if player not in played_players:
-                next_player = player
-                break
+        next_player = self.game.next_player()
         
         if not next_player:
             return
@@ -698,14 +693,12 @@ class SkullKingGUI:
             return
         
         hand = self.game.state.hands[next_player]
-        current_trick_list = [(p, c) for p, c in trick.cards_played]
-        previous_tricks = [[(p, c) for p, c in t.cards_played] for t in self.game.state.tricks]
         
         try:
             card = next_player.play_card(
                 hand,
-                current_trick_list,
-                previous_tricks,
+                trick.cards_played,
+                self.game.state.previous_tricks,
                 self.game.state.bids,
                 self.game.state.tricks_won,
                 self.game.state.round_num
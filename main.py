@@ -1,36 +1,21 @@
 """
 Main competition runner for Skull King bot competition.
 """
+import io
+import os
+import random
 import sys
-from typing import List
-from game_engine import SkullKingGame
-
-# Try to use Pygame first (best performance), then CustomTkinter, then regular tkinter
-try:
-    from gui_pygame import SkullKingGUI
-    USE_PYGAME = True
-    print("Using Pygame GUI (best performance)")
-except ImportError:
-    try:
-        from gui_customtkinter import SkullKingGUI
-        USE_PYGAME = False
-        print("Using CustomTkinter GUI")
-    except ImportError:
-        try:
-            from gui import SkullKingGUI
-            USE_PYGAME = False
-            print("Using Tkinter GUI (basic)")
-            print("Note: Install pygame or customtkinter for better rendering:")
-            print("  pip install pygame")
-            print("  or")
-            print("  pip install customtkinter")
-        except ImportError:
-            print("Error: Could not import GUI module")
-            sys.exit(1)
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Callable, Iterable, List, Tuple
+from game_engine import GameState, SkullKingGame
 
 from example_bots import RandomBot, ConservativeBot, AggressiveBot
 from player import Player
 
+# Characters of headless output buffered before each write to stdout
+_OUTPUT_CHUNK_SIZE = 64 * 1024
+
 
 def create_competition_bots() -> List[Player]:
     """
@@ -60,8 +45,37 @@ def create_competition_bots() -> List[Player]:
     return bots
 
 
+def _load_gui():
+    """
+    Import the best available GUI class.
+    
+    Imported on demand so headless runs never load pygame or tkinter.
+    """
+    # Try to use Pygame first (best performance), then CustomTkinter, then regular tkinter
+    try:
+        from gui_pygame import SkullKingGUI
+        print("Using Pygame GUI (best performance)")
+    except ImportError:
+        try:
+            from gui_customtkinter import SkullKingGUI
+            print("Using CustomTkinter GUI")
+        except ImportError:
+            try:
+                from gui import SkullKingGUI
+                print("Using Tkinter GUI (basic)")
+                print("Note: Install pygame or customtkinter for better rendering:")
+                print("  pip install pygame")
+                print("  or")
+                print("  pip install customtkinter")
+            except ImportError:
+                print("Error: Could not import GUI module")
+                sys.exit(1)
+    return SkullKingGUI
+
+
 def run_competition_with_gui(num_rounds: int = 10):
     """Run the competition with GUI display."""
+    SkullKingGUI = _load_gui()
     bots = create_competition_bots()
     
     if len(bots) < 2:
@@ -96,20 +110,58 @@ def run_competition_with_gui(num_rounds: int = 10):
     print("="*50)
 
 
-def run_competition_headless(num_rounds: int = 10, num_games: int = 1):
-    """Run the competition without GUI (for testing)."""
-    bots = create_competition_bots()
+def run_fast_simulation(bots: List[Player], num_rounds: int, num_games: int) -> bool:
+    """
+    Play all games with the Numba simulator and print statistics.
     
-    if len(bots) < 2:
-        print("Error: Need at least 2 bots to play")
-        return
+    Returns:
+        False if numba is unavailable or a bot is not an example bot type,
+        in which case nothing is played
+    """
+    try:
+        from fast_sim import bot_kinds, simulate_games
+    except ImportError:
+        print("Note: numba is not installed, using the regular engine")
+        print("  pip install numba")
+        return False
     
-    all_scores = {bot: [] for bot in bots}
+    kinds = bot_kinds(bots)
+    if kinds is None:
+        print("Note: custom bots can't be simulated, using the regular engine")
+        return False
     
-    for game_num in range(num_games):
-        print(f"\nGame {game_num + 1}/{num_games}")
-        print("-" * 50)
-        
+    scores = simulate_games(num_games, num_rounds, kinds, random.randrange(2**31))
+    avg_scores = scores.mean(axis=0)
+    print("\n" + "="*50)
+    print(f"STATISTICS (across {num_games} simulated games)")
+    print("="*50)
+    for bot, avg_score in zip(bots, avg_scores):
+        print(f"{bot.name}: Avg {avg_score:.1f} points")
+    print("="*50)
+    return True
+
+
+def _play_one_game(bots_factory: Callable[[], List[Player]], num_rounds: int,
+                   seed: int) -> Tuple[str, List[int]]:
+    """
+    Play one headless game with freshly created bots.
+    
+    Runs in a worker process, so it takes a bot factory rather than bot
+    instances and buffers its output instead of printing.
+    
+    Args:
+        bots_factory: Module-level function returning the bots, in seat order
+        num_rounds: Number of rounds to play
+        seed: Seed for the random module in this game
+    
+    Returns:
+        The game's printed log, and each bot's final score in seat order
+    """
+    random.seed(seed)
+    bots = bots_factory()
+    log = io.StringIO()
+    
+    with redirect_stdout(log):
         game = SkullKingGame(bots, num_rounds)
         
         # Play all rounds
@@ -130,32 +182,31 @@ def run_competition_headless(num_rounds: int = 10, num_games: int = 1):
                 while game.state.current_trick and \
                       len(game.state.current_trick.cards_played) < len(bots):
                     # Find next player
-                    played_players = {p for p, _ in game.state.current_trick.cards_played}
-                    next_player = next(p for p in bots if p not in played_players)
+                    next_player = game.next_player()
                     
                     # Get card from player
                     hand = game.state.hands[next_player]
-                    current_trick_list = [(p, c) for p, c in game.state.current_trick.cards_played]
-                    previous_tricks = [[(p, c) for p, c in t.cards_played] for t in game.state.tricks]
                     
                     try:
                         card = next_player.play_card(
                             hand,
-                            current_trick_list,
-                            previous_tricks,
+                            game.state.current_trick.cards_played,
+                            game.state.previous_tricks,
                             game.state.bids,
                             game.state.tricks_won,
                             round_num
                         )
-                        
-                        legal_cards = game.state.get_legal_cards(next_player)
-                        if card not in legal_cards:
-                            card = legal_cards[0] if legal_cards else hand[0]
-                        
-                        game.play_card(next_player, card)
                     except Exception as e:
-                        print(f"Error: {e}")
-                        break
+                        # A failing bot forfeits its choice; asking it again
+                        # would never move the trick on
+                        print(f"Error from {next_player.name}: {e}")
+                        card = None
+                    
+                    if card is None or not game.state.is_legal(next_player, card):
+                        legal_cards = game.state.get_legal_cards(next_player)
+                        card = legal_cards[0] if legal_cards else hand[0]
+                    
+                    game.play_card(next_player, card)
             
             # Calculate scores
             round_scores = game.calculate_scores()
@@ -168,29 +219,145 @@ def run_competition_headless(num_rounds: int = 10, num_games: int = 1):
         
         # Final scores
         final_scores = game.get_final_scores()
-        for bot in bots:
-            all_scores[bot].append(final_scores[bot])
-        
         print(f"\nFinal scores: {[(p.name, final_scores[p]) for p in bots]}")
     
+    return log.getvalue(), [final_scores[bot] for bot in bots]
+
+
+def _collect_games(results: Iterable[Tuple[str, List[int]]], all_scores: List[List[int]],
+                   out: io.StringIO):
+    """
+    Write each game's log to out, in game order, and record its scores.
+    
+    Flushes out to stdout whenever it holds _OUTPUT_CHUNK_SIZE characters.
+    
+    Args:
+        results: _play_one_game() results, in game order
+        all_scores: Per-game score rows for each bot in seat order, filled in
+        out: Buffer for output not yet written to stdout
+    """
+    num_games = len(all_scores[0])
+    for game_num, (log, final_scores) in enumerate(results):
+        out.write(f"\nGame {game_num + 1}/{num_games}\n")
+        out.write("-" * 50 + "\n")
+        out.write(log)
+        for seat_id, score in enumerate(final_scores):
+            all_scores[seat_id][game_num] = score
+        if out.tell() >= _OUTPUT_CHUNK_SIZE:
+            sys.stdout.write(out.getvalue())
+            out.seek(0)
+            out.truncate()
+
+
+def run_competition_headless(num_rounds: int = 10, num_games: int = 1, fast: bool = False,
+                             parallel: bool = True):
+    """
+    Run the competition without GUI (for testing).
+    
+    Games are independent, so with more than one game they are played in
+    parallel worker processes (unless parallel=False); each game's log is
+    printed in game order.
+    With fast=True, games between the example bots are played by the Numba
+    simulator in fast_sim.py and only the statistics are printed.
+    """
+    bots = create_competition_bots()
+    
+    if len(bots) < 2:
+        print("Error: Need at least 2 bots to play")
+        return
+    
+    if fast and run_fast_simulation(bots, num_rounds, num_games):
+        return
+    
+    # One preallocated row of per-game scores for each bot, in seat order
+    all_scores = [[0] * num_games for _ in bots]
+    
+    # Seed each game from the random module so seeding it still reproduces a run
+    base_seed = random.randrange(2**31)
+    factories = [create_competition_bots] * num_games
+    rounds = [num_rounds] * num_games
+    seeds = [base_seed + game_num for game_num in range(num_games)]
+    
+    # Collect output and write it to stdout in large chunks rather than
+    # paying for a line-buffered write on every print
+    out = io.StringIO()
+    if parallel and num_games > 1:
+        workers = min(os.cpu_count() or 1, num_games)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_play_one_game, factories, rounds, seeds,
+                                   chunksize=max(1, num_games // (workers * 4)))
+            try:
+                _collect_games(results, all_scores, out)
+            except BaseException:
+                # A failed game or Ctrl-C: drop the queued games rather than
+                # waiting for the whole batch before re-raising
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+    else:
+        _collect_games(map(_play_one_game, factories, rounds, seeds), all_scores, out)
+    
     # Print statistics
     if num_games > 1:
-        print("\n" + "="*50)
-        print("STATISTICS (across all games)")
-        print("="*50)
-        for bot in bots:
-            avg_score = sum(all_scores[bot]) / len(all_scores[bot])
-            print(f"{bot.name}: Avg {avg_score:.1f} points")
-        print("="*50)
+        out.write("\n" + "="*50 + "\n")
+        out.write("STATISTICS (across all games)\n")
+        out.write("="*50 + "\n")
+        for bot, scores in zip(bots, all_scores):
+            avg_score = sum(scores) / num_games
+            out.write(f"{bot.name}: Avg {avg_score:.1f} points\n")
+        out.write("="*50 + "\n")
+    
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+
+
+def run_profiled(num_games: int = 1, output: str = "prof.out"):
+    """
+    Profile headless games to find where the time goes.
+    
+    Games run in this process so the profiler sees them. Prints the 30 most
+    expensive calls by cumulative time and saves the full profile to output
+    (view it with: snakeviz prof.out). With LINE_PROFILE=1 set and
+    line_profiler installed, prints line-by-line timings of the game loop,
+    the engine's card play and legality check, and each bot's play_card.
+    """
+    if os.environ.get("LINE_PROFILE"):
+        try:
+            from line_profiler import LineProfiler
+        except ImportError:
+            print("Note: line_profiler is not installed, using cProfile")
+            print("  pip install line_profiler")
+        else:
+            bot_methods = {type(bot).play_card for bot in create_competition_bots()}
+            profiler = LineProfiler(_play_one_game, SkullKingGame.play_card,
+                                    GameState.is_legal, *bot_methods)
+            profiler.runcall(run_competition_headless, num_games=num_games, parallel=False)
+            profiler.print_stats()
+            return
+    
+    import cProfile
+    import pstats
+    
+    profiler = cProfile.Profile()
+    profiler.enable()
+    run_competition_headless(num_games=num_games, parallel=False)
+    profiler.disable()
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(30)
+    profiler.dump_stats(output)
+    print(f"Profile saved to {output} (view with: snakeviz {output})")
 
 
 if __name__ == "__main__":
     import sys
     
     # Check command line arguments
-    if len(sys.argv) > 1 and sys.argv[1] == "--headless":
+    if len(sys.argv) > 1 and sys.argv[1] == "--profile":
         num_games = int(sys.argv[2]) if len(sys.argv) > 2 else 1
-        run_competition_headless(num_games=num_games)
+        run_profiled(num_games=num_games)
+    elif len(sys.argv) > 1 and sys.argv[1] == "--headless":
+        fast = "--fast" in sys.argv
+        args = [arg for arg in sys.argv[2:] if arg != "--fast"]
+        num_games = int(args[0]) if args else 1
+        run_competition_headless(num_games=num_games, fast=fast)
     else:
         # Run with GUI by default
         run_competition_with_gui()
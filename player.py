@@ -2,8 +2,9 @@
 Base Player class for Skull King bots.
 """
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
 from typing import List, Dict, Optional
-from cards import Card
+from cards import Card, CardType
 
 
 class Player(ABC):
@@ -17,7 +18,88 @@ class Player(ABC):
             name: Name of the player/bot
         """
         self.name = name
+        self.seat_id: Optional[int] = None  # Index in the game's player list, set by the game
         self.hand: List[Card] = []
+        # Hand composition, kept in sync by add_card/remove_card so bots can
+        # answer "how many escapes / which Pirates" without scanning the hand
+        self._type_counts: Dict[CardType, int] = {t: 0 for t in CardType}
+        self._by_type: Dict[CardType, List[Card]] = {t: [] for t in CardType}
+        # Number cards sorted by value (ties keep deal order), with their values
+        # alongside so bisect can find insert/remove positions
+        self._numbers: List[Card] = []
+        self._number_values: List[int] = []
+    
+    def prepare_round(self, round_num: int):
+        """
+        Called by the game at the start of each round, before dealing.
+        
+        Override to precompute values that stay fixed for the whole round,
+        so make_bid() and play_card() don't redo the work on every call.
+        
+        Args:
+            round_num: The round about to be played (1-10)
+        """
+        pass
+    
+    def receive_hand(self, cards: List[Card]) -> List[Card]:
+        """
+        Take a newly dealt hand, replacing any previous one.
+        
+        Args:
+            cards: The cards dealt to this player for the round
+        
+        Returns:
+            The player's hand list (the game engine shares this list)
+        """
+        # Remove leftovers one by one so on_card_removed() sees every change
+        for card in list(self.hand):
+            self.remove_card(card)
+        self.hand = []
+        for card in cards:
+            self.add_card(card)
+        return self.hand
+    
+    def add_card(self, card: Card):
+        """Add a card to the hand and update the hand composition."""
+        self.hand.append(card)
+        self._type_counts[card.card_type] += 1
+        self._by_type[card.card_type].append(card)
+        if card.card_type == CardType.NUMBER:
+            i = bisect_right(self._number_values, card.value)
+            self._number_values.insert(i, card.value)
+            self._numbers.insert(i, card)
+        self.on_card_added(card)
+    
+    def remove_card(self, card: Card):
+        """Remove a card from the hand and update the hand composition."""
+        self.hand.remove(card)
+        self._type_counts[card.card_type] -= 1
+        self._by_type[card.card_type].remove(card)
+        if card.card_type == CardType.NUMBER:
+            i = bisect_left(self._number_values, card.value)
+            while self._numbers[i] != card:
+                i += 1
+            del self._number_values[i]
+            del self._numbers[i]
+        self.on_card_removed(card)
+    
+    def on_card_added(self, card: Card):
+        """Called after a card joins the hand; override to keep custom tallies."""
+        pass
+    
+    def on_card_removed(self, card: Card):
+        """Called after a card leaves the hand; override to keep custom tallies."""
+        pass
+    
+    def lowest_number(self) -> Optional[Card]:
+        """Lowest numbered card in hand (first dealt on ties), or None."""
+        return self._numbers[0] if self._numbers else None
+    
+    def highest_number(self) -> Optional[Card]:
+        """Highest numbered card in hand (first dealt on ties), or None."""
+        if not self._numbers:
+            return None
+        return self._numbers[bisect_left(self._number_values, self._number_values[-1])]
     
     @abstractmethod
     def make_bid(self, hand: List[Card], round_num: int, previous_bids: Dict['Player', int]) -> int:
@@ -35,7 +117,7 @@ class Player(ABC):
         pass
     
     @abstractmethod
-    def play_card(self, hand: List[Card], current_trick: List[tuple], previous_tricks: List[list], 
+    def play_card(self, hand: List[Card], current_trick: List[tuple], previous_tricks: List[tuple], 
                   bids: Dict['Player', int], tricks_won: Dict['Player', int], 
                   round_num: int) -> Card:
         """
@@ -43,8 +125,9 @@ class Player(ABC):
         
         Args:
             hand: The player's current hand
-            current_trick: List of (player, card) tuples for the current trick
-            previous_tricks: List of previous tricks (each trick is a list of (player, card) tuples)
+            current_trick: List of (player, card) tuples for the current trick.
+                This is the game's own list, so read it but don't modify it
+            previous_tricks: List of previous tricks (each trick is a tuple of (player, card) tuples)
             bids: Dictionary of all players' bids for this round
             tricks_won: Dictionary of tricks won so far this round
             round_num: Current round number